@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 import cv2
+import numpy as np
 import pandas as pd
 
 img_path = 'pic3.jpg'
@@ -6,58 +9,76 @@ csv_path = 'colors.csv'
 # reading csv file
 index = ['color', 'color_name', 'hex', 'R', 'G', 'B']
 df = pd.read_csv(csv_path, names=index, header=None)
+#palette as one contiguous (N,3) array so lookups don't go through pandas;
+#int16 so subtracting a pixel value can't wrap around like uint8 would
+palette = np.ascontiguousarray(df[['R', 'G', 'B']].to_numpy(dtype=np.int16))
+color_names = df['color_name'].to_numpy()
 
 # reading image
 img = cv2.imread(img_path)
 img = cv2.resize(img, (800,600))
 
 #declaring global variables
-clicked = False
 r = g = b = xpos = ypos = 0
+last_drawn = None
+
+#text settings for the color info banner, set up once instead of on every draw
+font = cv2.FONT_HERSHEY_COMPLEX
+font_scale = 0.8
+text_pos = (50,50)
+white = (255,255,255)
+black = (0,0,0)
+text_format = '{} R={} G={} B={}'.format
 
 #function to calculate minimum distance from all colors and get the most matching color
+#results are cached since the same colors tend to get clicked again
+@lru_cache(maxsize=4096)
 def get_color_name(R,G,B):
-minimum = 1000
-for i in range(len(df)):
-d = abs(R - int(df.loc[i,'R'])) + abs(G - int(df.loc[i,'G'])) + abs(B - int(df.loc[i,'B']))
-if d <= minimum:
-minimum = d
-cname = df.loc[i, 'color_name']
+    #distance to every color in one vectorized pass instead of a df.loc lookup per row
+    d = np.abs(palette - (R, G, B)).sum(axis=1)
+    #on ties keep the last matching row, as the old '<=' scan did
+    cname = color_names[len(d) - 1 - np.argmin(d[::-1])]
+
+    return cname
+
+#function to draw the picked color and its name on the image and show the result
+def draw_color_info():
+    #cv2.rectangle(image, startpoint, endpoint, color, thickness)-1 fills entire rectangle
+    cv2.rectangle(img, (20,20), (600,60), (b,g,r), -1)
 
-return cname
+    #Creating text string to display( Color name and RGB values )
+    text = text_format(get_color_name(r,g,b), r, g, b)
+    #For very light colours we will display text in black colour
+    text_color = black if r+g+b >=600 else white
+    #cv2.putText(img,text,start,font(0-7),fontScale,color,thickness,lineType )
+    cv2.putText(img, text, text_pos, font, font_scale, text_color, 2, cv2.LINE_AA)
+
+    cv2.imshow('image', img)
 
 #function to get x,y coordinates of mouse double click
 def draw_function(event, x, y, flags, params):
-if event == cv2.EVENT_LBUTTONDBLCLK:
-global b, g, r, xpos, ypos, clicked
-clicked = True
-xpos = x
-ypos = y
-b,g,r = img[y,x]
-b = int(b)
-g = int(g)
-r = int(r)
+    if event == cv2.EVENT_LBUTTONDBLCLK:
+        global b, g, r, xpos, ypos, last_drawn
+        xpos = x
+        ypos = y
+        b,g,r = img[y,x]
+        b = int(b)
+        g = int(g)
+        r = int(r)
+        #the banner already shows this color, so there is nothing to redraw
+        if (r,g,b) != last_drawn:
+            last_drawn = (r,g,b)
+            draw_color_info()
 
 # creating window
 cv2.namedWindow('image')
 cv2.setMouseCallback('image', draw_function)
-
-while True:
 cv2.imshow('image', img)
-if clicked:
-#cv2.rectangle(image, startpoint, endpoint, color, thickness)-1 fills entire rectangle
-cv2.rectangle(img, (20,20), (600,60), (b,g,r), -1)
-
-#Creating text string to display( Color name and RGB values )
-text = get_color_name(r,g,b) + ' R=' + str(r) + ' G=' + str(g) + ' B=' + str(b)
-#cv2.putText(img,text,start,font(0-7),fontScale,color,thickness,lineType )
-cv2.putText(img, text, (50,50), 2,0.8, (255,255,255),2,cv2.LINE_AA)
-
-#For very light colours we will display text in black colour
-if r+g+b >=600:
-cv2.putText(img, text, (50,50), 2,0.8, (0,0,0),2,cv2.LINE_AA)
 
-if cv2.waitKey(20) & 0xFF == 27:
-break
+#the image is only redrawn from the mouse callback, so the loop just pumps events
+#until Esc is pressed or the window is closed
+while cv2.waitKey(20) & 0xFF != 27:
+    if cv2.getWindowProperty('image', cv2.WND_PROP_VISIBLE) < 1:
+        break
 
 cv2.destroyAllWindows()